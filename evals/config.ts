@@ -2,12 +2,10 @@
  * Configuration for Apify MCP Server evaluations.
  */
 
-import { readFileSync } from 'node:fs';
-import { dirname, join } from 'node:path';
-import { fileURLToPath } from 'node:url';
-
 import log from '@apify/log';
 
+import { loadTestCases } from './shared/test_case_loader.js';
+
 // Re-export shared config
 export {
     OPENROUTER_CONFIG,
@@ -18,10 +16,9 @@ export {
 } from './shared/config.js';
 
 // Read the version from test-cases.json
+// Goes through the shared loader so scripts that also load the test cases parse the file only once
 function getTestCasesVersion(): string {
-    const dir = dirname(fileURLToPath(import.meta.url));
-    const raw = readFileSync(join(dir, 'test_cases.json'), 'utf-8');
-    return JSON.parse(raw).version;
+    return loadTestCases('test_cases.json').version;
 }
 
 // Evaluator names
@@ -50,12 +47,27 @@ export const TOOL_SELECTION_EVAL_MODEL = 'deepseek/deepseek-v4-flash';
 export const PHOENIX_RETRY_DELAY_MS = 10_000;
 export const PHOENIX_MAX_RETRIES = 3;
 
+// Retries for rate-limited (429) or failed OpenRouter calls. The OpenAI SDK backs off exponentially
+// and honors retry-after headers, so concurrent examples slow down instead of failing the experiment.
+export const LLM_MAX_RETRIES = 5;
+
+// Total number of dataset examples run in parallel across all models.
+// Every model (and the judge) shares one OpenRouter key, so this budget is split evenly between the
+// concurrently running experiments: each gets floor(EXPERIMENT_CONCURRENCY / models), at least 1.
+export const EXPERIMENT_CONCURRENCY = 10;
+
 export const PASS_THRESHOLD = 0.7;
 
 // LLM sampling parameters
 // Temperature = 0 provides deterministic, focused responses
 export const TEMPERATURE = 0;
 
+// Upper bound on tokens generated per tool selection call.
+// Only the tool calls (names and arguments) and a short message are needed, so this caps runaway prose.
+// Kept generous because reasoning models count thinking tokens against it and the LLM judge
+// checks tool arguments, so truncated calls would fail for the wrong reason.
+export const MAX_OUTPUT_TOKENS = 4096;
+
 export const DATASET_NAME = `mcp_server_dataset_v${getTestCasesVersion()}`;
 
 // System prompt - instructions mainly cursor (very similar instructions in copilot)
@@ -4,7 +4,6 @@
  * Run this once to upload test cases to Phoenix platform and receive a dataset ID.
  */
 
-import { createClient } from '@arizeai/phoenix-client';
 // eslint-disable-next-line import/extensions
 import { createDataset } from '@arizeai/phoenix-client/datasets';
 import dotenv from 'dotenv';
@@ -14,8 +13,10 @@ import { hideBin } from 'yargs/helpers';
 
 import log from '@apify/log';
 
-import { sanitizeEnvValue, sanitizeProcessEnv, validatePhoenixEnvVars } from './config.js';
-import { loadTestCases, filterByCategory, filterById, type TestCase } from './evaluation_utils.js';
+import { sanitizeProcessEnv, validatePhoenixEnvVars } from './config.js';
+import type { TestCase } from './evaluation_utils.js';
+import { getPhoenixClient } from './phoenix_client.js';
+import { loadTestCases, filterByCategory, filterById } from './shared/test_case_loader.js';
 
 // Set log level to debug
 log.setLevel(log.LEVELS.INFO);
@@ -76,27 +77,17 @@ const argv = yargs(hideBin(process.argv))
 async function createDatasetFromTestCases(testCases: TestCase[], datasetName: string, version: string): Promise<void> {
     log.info('Creating Phoenix dataset from test cases...');
 
-    // Validate environment variables
-    if (!validatePhoenixEnvVars()) {
-        process.exit(1);
-    }
-
     log.info(`Loaded ${testCases.length} test cases`);
 
     // Convert to format expected by Phoenix
     const examples = testCases.map((testCase) => ({
         input: { query: testCase.query, context: testCase.context || '' },
-        output: { expectedTools: testCase.expectedTools?.join(', '), reference: testCase.reference || '' },
+        // Stored as a list so the exact match evaluator can compare it without string parsing
+        output: { expectedTools: testCase.expectedTools ?? [], reference: testCase.reference || '' },
         metadata: { category: testCase.category },
     }));
 
-    // Initialize Phoenix client
-    const client = createClient({
-        options: {
-            baseUrl: process.env.PHOENIX_BASE_URL!,
-            headers: { Authorization: `Bearer ${sanitizeEnvValue(process.env.PHOENIX_API_KEY)}` },
-        },
-    });
+    const client = getPhoenixClient();
 
     log.info(`Uploading dataset '${datasetName}' to Phoenix...`);
 
@@ -129,6 +120,11 @@ async function createDatasetFromTestCases(testCases: TestCase[], datasetName: st
 
 // Run the script
 async function main(): Promise<void> {
+    // Validate environment variables before reading and filtering test cases
+    if (!validatePhoenixEnvVars()) {
+        process.exit(1);
+    }
+
     try {
         // Load test cases from specified file
 
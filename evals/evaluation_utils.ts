@@ -9,17 +9,18 @@ import OpenAI from 'openai';
 
 import log from '@apify/log';
 
-import { ApifyClient } from '../src/apify_client.js';
-import { getToolPublicFieldOnly, processParamsGetTools } from '../src/index_internals.js';
 import type { ToolBase, ToolEntry } from '../src/types.js';
 import {
     SYSTEM_PROMPT,
     TOOL_CALLING_BASE_TEMPLATE,
     TOOL_SELECTION_EVAL_MODEL,
     EVALUATOR_NAMES,
+    LLM_MAX_RETRIES,
     TEMPERATURE,
+    MAX_OUTPUT_TOKENS,
     OPENROUTER_CONFIG,
 } from './config.js';
+import { buildCacheKey, getCachedResponse, setCachedResponse } from './llm_cache.js';
 import { transformToolsToOpenAIFormat } from './shared/openai_tools.js';
 import { loadTestCases as loadTestCasesShared, filterByCategory, filterById } from './shared/test_case_loader.js';
 import type { ToolSelectionTestCase, TestData } from './shared/types.js';
@@ -41,6 +42,12 @@ export function loadTestCases(filePath: string): TestData {
 }
 
 export async function loadTools(): Promise<ToolBase[]> {
+    // The server modules pull in the whole tool graph, so load them only when a run actually needs the tools
+    // (not for --help, failed env validation, or scripts that only read test cases)
+    const [{ ApifyClient }, { getToolPublicFieldOnly, processParamsGetTools }] = await Promise.all([
+        import('../src/apify_client.js'),
+        import('../src/index_internals.js'),
+    ]);
     const apifyClient = new ApifyClient({ token: process.env.APIFY_API_TOKEN || '' });
     // Expose the storage category so dataset/KV tool-selection cases have their tools available;
     // the default toolset only auto-injects get-dataset-items and get-key-value-store-record.
@@ -48,8 +55,42 @@ export async function loadTools(): Promise<ToolBase[]> {
     return urlTools.map((t: ToolEntry) => getToolPublicFieldOnly(t)) as ToolBase[];
 }
 
-export function createOpenRouterTask(modelName: string, tools: ToolBase[]) {
-    const toolsOpenAI = transformToolsToOpenAIFormat(tools);
+// All models are evaluated against the same loaded tools, so the OpenAI-format payload is built once
+// and the same objects are passed to every request rather than rebuilt per model
+const openAIToolsCache = new WeakMap<ToolBase[], OpenAI.Chat.Completions.ChatCompletionTool[]>();
+
+function getOpenAITools(tools: ToolBase[]): OpenAI.Chat.Completions.ChatCompletionTool[] {
+    let toolsOpenAI = openAIToolsCache.get(tools);
+    if (!toolsOpenAI) {
+        toolsOpenAI = transformToolsToOpenAIFormat(tools);
+        openAIToolsCache.set(tools, toolsOpenAI);
+    }
+    return toolsOpenAI;
+}
+
+// Every evaluated model is served by the same OpenRouter endpoint, so all tasks share one client and its
+// keep-alive connection pool. Node's fetch does not cap connections per origin, so the number of in-flight
+// requests is bounded only by the experiment concurrency.
+let openRouterClient: OpenAI | undefined;
+
+function getOpenRouterClient(): OpenAI {
+    if (!openRouterClient) {
+        openRouterClient = new OpenAI({ ...OPENROUTER_CONFIG, maxRetries: LLM_MAX_RETRIES });
+    }
+    return openRouterClient;
+}
+
+export type OpenRouterTaskOptions = {
+    /** Reuse responses from the on-disk LLM cache (ignored when TEMPERATURE > 0) */
+    cache?: boolean;
+};
+
+export function createOpenRouterTask(modelName: string, tools: ToolBase[], options: OpenRouterTaskOptions = {}) {
+    // Resolved once per model so every example reuses the same tool payload and HTTP connection pool
+    const toolsOpenAI = getOpenAITools(tools);
+    const client = getOpenRouterClient();
+    // Non-deterministic sampling would make cached responses unrepresentative
+    const useCache = Boolean(options.cache) && TEMPERATURE === 0;
 
     return async (
         example: ExampleInputOnly,
@@ -60,9 +101,7 @@ export function createOpenRouterTask(modelName: string, tools: ToolBase[]) {
         context: string;
         reference: string;
     }> => {
-        const client = new OpenAI(OPENROUTER_CONFIG);
-
-        log.info(`Input: ${JSON.stringify(example)}`);
+        log.debug(`Input: ${JSON.stringify(example)}`);
 
         const context = JSON.stringify(example.input?.context ?? {});
         const query = String(example.input?.query ?? '');
@@ -83,20 +122,42 @@ export function createOpenRouterTask(modelName: string, tools: ToolBase[]) {
             content: query,
         });
 
-        log.info(`Messages to model: ${JSON.stringify(messages)}`);
+        log.debug(`Messages to model: ${JSON.stringify(messages)}`);
 
-        const response = await client.chat.completions.create({
+        const request: OpenAI.Chat.Completions.ChatCompletionCreateParamsNonStreaming = {
             model: modelName,
             messages,
             tools: toolsOpenAI,
             temperature: TEMPERATURE, // Use configured temperature (0 = deterministic)
-        });
+            max_tokens: MAX_OUTPUT_TOKENS,
+        };
 
-        log.info(`Model response: ${JSON.stringify(response.choices[0])}`);
+        const cacheKey = useCache ? buildCacheKey(request) : undefined;
+        let message = cacheKey ? getCachedResponse<OpenAI.Chat.Completions.ChatCompletionMessage>(cacheKey) : undefined;
+
+        if (message) {
+            log.debug(`Model response (cached): ${JSON.stringify(message)}`);
+        } else {
+            const response = await client.chat.completions.create(request);
+            log.debug(`Model response: ${JSON.stringify(response.choices[0])}`);
+            message = response.choices[0].message;
+            // Hitting MAX_OUTPUT_TOKENS (reasoning tokens count too) can drop or cut off tool calls,
+            // so the result is not a genuine tool choice and must not be replayed from the cache
+            const truncated = response.choices[0].finish_reason === 'length';
+            if (truncated) {
+                log.warning(
+                    `Model ${modelName} hit max_tokens (${MAX_OUTPUT_TOKENS}), tool calls may be missing or incomplete`,
+                    { query },
+                );
+            }
+            if (cacheKey && !truncated) {
+                setCachedResponse(cacheKey, message);
+            }
+        }
 
         return {
-            tool_calls: response.choices[0].message.tool_calls || [],
-            llm_response: response.choices[0].message.content || '',
+            tool_calls: message.tool_calls || [],
+            llm_response: message.content || '',
             query: String(example.input?.query ?? ''),
             context: String(JSON.stringify(example.input?.context ?? '{}')),
             reference: String(example.input?.reference ?? ''),
@@ -131,7 +192,7 @@ export function createToolSelectionLLMEvaluator(tools: ToolBase[]) {
                 // tool_definitions: JSON.stringify(tools)
             };
 
-            log.info(`Evaluating tool selection.
+            log.debug(`Evaluating tool selection.
 Input: query: ${input?.query},
 context: ${JSON.stringify(input?.context || {})},
 tool_calls: ${JSON.stringify(output?.tool_calls)},
@@ -0,0 +1,51 @@
+/**
+ * Opt-in on-disk cache for LLM responses used by the tool selection evaluation.
+ * Re-running the evaluation with unchanged tools, prompts and models reuses stored responses
+ * instead of paying for identical deterministic completions again.
+ */
+
+import { createHash } from 'node:crypto';
+import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+/** Default cache location: evals/.cache/<first two key chars>/<key>.json */
+export const LLM_CACHE_DIR = join(dirname(fileURLToPath(import.meta.url)), '.cache');
+
+/**
+ * Build a cache key from the full LLM request (model, messages, tools, sampling params).
+ * Requests are constructed in a fixed property order, so plain JSON serialization is stable.
+ */
+export function buildCacheKey(request: object): string {
+    return createHash('sha256').update(JSON.stringify(request)).digest('hex');
+}
+
+function getCachePath(key: string, cacheDir: string): string {
+    return join(cacheDir, key.slice(0, 2), `${key}.json`);
+}
+
+/**
+ * Read a cached response, returns undefined on miss or unreadable entry
+ */
+export function getCachedResponse<T>(key: string, cacheDir: string = LLM_CACHE_DIR): T | undefined {
+    const filePath = getCachePath(key, cacheDir);
+    if (!existsSync(filePath)) {
+        return undefined;
+    }
+
+    try {
+        return JSON.parse(readFileSync(filePath, 'utf-8')) as T;
+    } catch {
+        // A partially written or corrupted entry is treated as a miss and overwritten on the next call
+        return undefined;
+    }
+}
+
+/**
+ * Store a response in the cache
+ */
+export function setCachedResponse(key: string, value: unknown, cacheDir: string = LLM_CACHE_DIR): void {
+    const filePath = getCachePath(key, cacheDir);
+    mkdirSync(dirname(filePath), { recursive: true });
+    writeFileSync(filePath, JSON.stringify(value), 'utf-8');
+}
@@ -0,0 +1,28 @@
+/**
+ * Phoenix client shared by the Phoenix-based evaluation scripts.
+ * Kept out of config.ts so scripts that never talk to Phoenix do not load the client.
+ */
+
+import { createClient } from '@arizeai/phoenix-client';
+
+import { sanitizeEnvValue } from './shared/config.js';
+
+type PhoenixClient = ReturnType<typeof createClient>;
+
+let phoenixClient: PhoenixClient | undefined;
+
+/**
+ * Get the Phoenix client shared by all evaluation steps in this process
+ * Created on first use, so call it only after env vars are loaded and validated
+ */
+export function getPhoenixClient(): PhoenixClient {
+    if (!phoenixClient) {
+        phoenixClient = createClient({
+            options: {
+                baseUrl: process.env.PHOENIX_BASE_URL!,
+                headers: { Authorization: `Bearer ${sanitizeEnvValue(process.env.PHOENIX_API_KEY)}` },
+            },
+        });
+    }
+    return phoenixClient;
+}
@@ -3,7 +3,6 @@
  * Main evaluation script for MCP tool calling (TypeScript version).
  */
 
-import { createClient } from '@arizeai/phoenix-client';
 // eslint-disable-next-line import/extensions
 import { getDatasetInfo } from '@arizeai/phoenix-client/datasets';
 // eslint-disable-next-line import/extensions
@@ -18,17 +17,19 @@ import log from '@apify/log';
 
 import {
     DATASET_NAME,
+    EXPERIMENT_CONCURRENCY,
     MODELS_TO_EVALUATE,
     PASS_THRESHOLD,
     EVALUATOR_NAMES,
     PHOENIX_RETRY_DELAY_MS,
     PHOENIX_MAX_RETRIES,
     type EvaluatorName,
-    sanitizeEnvValue,
     sanitizeProcessEnv,
     validatePhoenixEnvVars,
 } from './config.js';
 import { loadTools, createOpenRouterTask, createToolSelectionLLMEvaluator } from './evaluation_utils.js';
+import { getPhoenixClient } from './phoenix_client.js';
+import { getSortedExpectedTools, getSortedOutputTools, sortedToolListsEqual } from './shared/tool_match.js';
 
 type EvaluatorResult = {
     model: string;
@@ -47,10 +48,11 @@ type EvaluatorResult = {
  */
 type CliArgs = {
     datasetName?: string;
+    concurrency: number;
+    cache: boolean;
+    verbose: boolean;
 };
 
-log.setLevel(log.LEVELS.DEBUG);
-
 const RUN_LLM_EVALUATOR = true;
 const RUN_TOOLS_EXACT_MATCH_EVALUATOR = true;
 
@@ -67,28 +69,52 @@ const argv = yargs(hideBin(process.argv))
         describe: 'Custom dataset name to evaluate (default: from config.ts)',
         example: 'my_custom_dataset',
     })
+    .option('concurrency', {
+        type: 'number',
+        describe: 'Total number of examples evaluated in parallel, split evenly between models',
+        default: EXPERIMENT_CONCURRENCY,
+    })
+    .option('cache', {
+        type: 'boolean',
+        describe: 'Reuse LLM responses cached on disk in evals/.cache (use --no-cache to force fresh calls)',
+        default: process.env.EVAL_CACHE === '1',
+    })
+    .option('verbose', {
+        type: 'boolean',
+        describe: 'Log full per-example payloads (inputs, prompts, evaluator inputs)',
+        default: false,
+    })
+    .check((args) => {
+        if (!Number.isInteger(args.concurrency) || args.concurrency < 1) {
+            throw new Error(`--concurrency must be an integer >= 1, got: ${args.concurrency}`);
+        }
+        return true;
+    })
     .help('help')
     .alias('h', 'help')
     .version(false)
     .epilogue('Examples:')
     .epilogue('  $0                                    # Use default dataset from config')
     .epilogue('  $0 --dataset-name tmp-1               # Evaluate custom dataset')
+    .epilogue('  $0 --concurrency 20                   # Run more examples in parallel')
+    .epilogue('  $0 --cache                            # Reuse cached LLM responses from previous runs')
+    .epilogue('  $0 --verbose                          # Log full per-example payloads')
     .epilogue('  pnpm run evals:run -- --dataset-name custom_v1  # Via pnpm script')
     .parseSync() as CliArgs;
 
+// Per-example payload dumps are debug-only: with concurrent experiments they dominate console output
+log.setLevel(argv.verbose ? log.LEVELS.DEBUG : log.LEVELS.INFO);
+
 // Tools match evaluator: returns score 1 if expected tool_calls match output list, 0 otherwise
 const toolsExactMatch = asEvaluator({
     name: EVALUATOR_NAMES.TOOLS_EXACT_MATCH,
     kind: 'CODE',
     evaluate: async ({ output, expected }: any) => {
-        log.info(`Evaluating tools match. Expected: ${JSON.stringify(expected)}, Output: ${JSON.stringify(output)}`);
+        log.debug(`Evaluating tools match. Expected: ${JSON.stringify(expected)}, Output: ${JSON.stringify(output)}`);
 
-        let expectedTools = expected?.expectedTools || [];
-        if (typeof expectedTools === 'string') {
-            expectedTools = expectedTools.split(', ');
-        }
+        const normalizedExpectedTools = getSortedExpectedTools(expected?.expectedTools);
 
-        if (!expectedTools || expectedTools.length === 0) {
+        if (normalizedExpectedTools.length === 0) {
             log.debug('Tools match: No expected tools provided');
             return {
                 score: 1.0,
@@ -96,23 +122,9 @@ const toolsExactMatch = asEvaluator({
             };
         }
 
-        // No special normalization needed - tools are independent
-        const normalizeToolName = (toolName: string): string => {
-            return toolName;
-        };
-
-        const normalizeToolCall = (toolCall: any): string => {
-            return toolCall.function?.name || '';
-        };
-
-        // Normalize expected tools
-        const normalizedExpectedTools = [...expectedTools].map(normalizeToolName).sort();
-
-        const outputToolsTmp = (output?.tool_calls || []).map(normalizeToolCall).sort();
-
-        const outputToolsSet = Array.from(new Set(outputToolsTmp)).sort();
         // it is correct if outputTools includes multiple calls to the same tool
-        const isCorrect = JSON.stringify(normalizedExpectedTools) === JSON.stringify(outputToolsSet);
+        const outputToolsSet = getSortedOutputTools(output?.tool_calls);
+        const isCorrect = sortedToolListsEqual(normalizedExpectedTools, outputToolsSet);
         const score = isCorrect ? 1.0 : 0.0;
         const explanation = `Expected: ${JSON.stringify(normalizedExpectedTools)}, Got: ${JSON.stringify(outputToolsSet)}`;
 
@@ -137,8 +149,13 @@ function processEvaluatorResult(
     const evalRuns = experiment.evaluationRuns ?? [];
     const total = Object.keys(runsMap).length;
 
-    const evaluatorRuns = evalRuns.filter((er: ExperimentEvaluationRun) => er.name === evaluatorName);
-    const correct = evaluatorRuns.filter((er: ExperimentEvaluationRun) => (er.result?.score ?? 0) > 0.5).length;
+    // Count passing runs in one pass instead of materializing filtered arrays just to take their length
+    let correct = 0;
+    for (const er of evalRuns as ExperimentEvaluationRun[]) {
+        if (er.name === evaluatorName && (er.result?.score ?? 0) > 0.5) {
+            correct++;
+        }
+    }
     const accuracy = total > 0 ? correct / total : 0;
 
     return {
@@ -174,7 +191,7 @@ function printResults(results: EvaluatorResult[]): void {
     }
 }
 
-async function main(datasetName: string): Promise<number> {
+async function main(datasetName: string, concurrency: number, cache: boolean): Promise<number> {
     log.info('Starting MCP tool calling evaluation');
 
     if (!validatePhoenixEnvVars()) {
@@ -184,13 +201,7 @@ async function main(datasetName: string): Promise<number> {
     const tools = await loadTools();
     log.info(`Loaded ${tools.length} tools`);
 
-    // Phoenix client init (options may be provided via env)
-    const client = createClient({
-        options: {
-            baseUrl: process.env.PHOENIX_BASE_URL!,
-            headers: { Authorization: `Bearer ${sanitizeEnvValue(process.env.PHOENIX_API_KEY)}` },
-        },
-    });
+    const client = getPhoenixClient();
 
     // Considered using a retry package, but opted for this simple loop with delay for clarity and transparency.
     // A helper like withRetry could be used, but it would not significantly reduce code complexity here.
@@ -215,16 +226,21 @@ async function main(datasetName: string): Promise<number> {
 
     log.info(`Loaded dataset "${datasetName}" with ID: ${datasetId}`);
 
-    const results: EvaluatorResult[] = [];
-
     // Create the LLM evaluator with loaded tools
     const toolSelectionLLMEvaluator = createToolSelectionLLMEvaluator(tools);
 
-    for (const modelName of MODELS_TO_EVALUATE) {
+    // Each model's experiment is independent and I/O-bound, so all models are evaluated concurrently.
+    // They share one OpenRouter key (and the judge model), so the concurrency budget is split between them
+    // to keep the total number of in-flight requests at `concurrency`.
+    const perModelConcurrency = Math.max(1, Math.floor(concurrency / MODELS_TO_EVALUATE.length));
+    log.info(`Running ${MODELS_TO_EVALUATE.length} models with concurrency ${perModelConcurrency} each`);
+
+    const evaluateModel = async (modelName: string): Promise<EvaluatorResult[]> => {
+        const modelResults: EvaluatorResult[] = [];
         log.info(`\nEvaluating model: ${modelName}`);
 
         // OpenRouter task
-        const taskFn = createOpenRouterTask(modelName, tools);
+        const taskFn = createOpenRouterTask(modelName, tools, { cache });
 
         // Get PR info for better tracking
         const prNumber = process.env.GITHUB_PR_NUMBER || 'local';
@@ -252,15 +268,15 @@ async function main(datasetName: string): Promise<number> {
                     evaluators,
                     experimentName,
                     experimentDescription,
-                    concurrency: 10,
+                    concurrency: perModelConcurrency,
                 });
                 log.info(`Experiment run completed`);
 
                 // Process each evaluator separately
-                results.push(
+                modelResults.push(
                     processEvaluatorResult(experiment, modelName, experimentName, EVALUATOR_NAMES.TOOLS_EXACT_MATCH),
                 );
-                results.push(
+                modelResults.push(
                     processEvaluatorResult(experiment, modelName, experimentName, EVALUATOR_NAMES.TOOL_SELECTION_LLM),
                 );
                 experimentSucceeded = true;
@@ -282,7 +298,7 @@ async function main(datasetName: string): Promise<number> {
         if (!experimentSucceeded) {
             // Add error results for both evaluators
             Object.values(EVALUATOR_NAMES).forEach((evaluatorName) => {
-                results.push({
+                modelResults.push({
                     model: modelName,
                     experimentName,
                     experimentId: '',
@@ -295,7 +311,11 @@ async function main(datasetName: string): Promise<number> {
                 });
             });
         }
-    }
+
+        return modelResults;
+    };
+
+    const results = (await Promise.all(MODELS_TO_EVALUATE.map(evaluateModel))).flat();
 
     printResults(results);
 
@@ -304,7 +324,7 @@ async function main(datasetName: string): Promise<number> {
 }
 
 // Run
-main(argv.datasetName || DATASET_NAME)
+main(argv.datasetName || DATASET_NAME, argv.concurrency, argv.cache)
     .then((code) => process.exit(code))
     .catch((err) => {
         log.error('Unexpected error:', err);
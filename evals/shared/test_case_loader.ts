@@ -8,9 +8,13 @@ import { fileURLToPath } from 'node:url';
 
 import type { BaseTestCase, TestData } from './types.js';
 
+/** Parsed test case files keyed by resolved path, so repeated loads in one process parse the file once */
+const testDataCache = new Map<string, TestData>();
+
 /**
  * Load test cases from a JSON file
  * Supports both relative and absolute paths
+ * Results are cached per path for the lifetime of the process; treat the returned data as read-only
  *
  * @param filePath - Path to test cases JSON file (relative to caller or absolute)
  * @returns Test data with version and test cases
@@ -28,8 +32,15 @@ export function loadTestCases(filePath: string): TestData {
         testCasesPath = join(dirname, '..', filePath);
     }
 
+    const cached = testDataCache.get(testCasesPath);
+    if (cached) {
+        return cached;
+    }
+
     const fileContent = readFileSync(testCasesPath, 'utf-8');
-    return JSON.parse(fileContent) as TestData;
+    const testData = JSON.parse(fileContent) as TestData;
+    testDataCache.set(testCasesPath, testData);
+    return testData;
 }
 
 /**
@@ -0,0 +1,55 @@
+/**
+ * Tool name helpers for the exact match evaluator
+ * Kept free of side effects so they can be imported by tests without running an evaluation
+ */
+
+/**
+ * Tool call as returned by the OpenAI-compatible chat completions API (only the name is needed)
+ */
+type ToolCallLike = {
+    function?: { name?: string };
+};
+
+// Datasets store expected tools as a list; datasets created before that store a comma-joined string.
+// Legacy strings are fixed per example, so each distinct value is parsed and sorted once per run
+// instead of on every evaluator call (models × examples)
+const sortedExpectedToolsCache = new Map<string, string[]>();
+
+/**
+ * Get the expected tool names of an example, sorted
+ * Accepts both the list format and the legacy comma-joined string; returns [] when nothing is expected.
+ * The returned array may be shared between calls and must not be mutated.
+ */
+export function getSortedExpectedTools(expectedTools: string | string[] | undefined | null): string[] {
+    if (!expectedTools || expectedTools.length === 0) {
+        return [];
+    }
+    if (Array.isArray(expectedTools)) {
+        return [...expectedTools].sort();
+    }
+    let sorted = sortedExpectedToolsCache.get(expectedTools);
+    if (!sorted) {
+        sorted = expectedTools.split(', ').sort();
+        sortedExpectedToolsCache.set(expectedTools, sorted);
+    }
+    return sorted;
+}
+
+/**
+ * Get the distinct tool names called by the model, sorted
+ * Repeated calls to the same tool count once, so they still match a single expected entry.
+ */
+export function getSortedOutputTools(toolCalls: ToolCallLike[] | undefined | null): string[] {
+    return Array.from(new Set((toolCalls || []).map((toolCall) => toolCall.function?.name || ''))).sort();
+}
+
+/**
+ * Compare two sorted tool name lists
+ * The length check rejects the common mismatch (missing or extra tool) without comparing any names.
+ */
+export function sortedToolListsEqual(expected: string[], actual: string[]): boolean {
+    if (expected.length !== actual.length) {
+        return false;
+    }
+    return expected.every((toolName, i) => toolName === actual[i]);
+}
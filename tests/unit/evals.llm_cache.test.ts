@@ -0,0 +1,53 @@
+import { mkdirSync, mkdtempSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+
+import { buildCacheKey, getCachedResponse, setCachedResponse } from '../../evals/llm_cache.js';
+
+describe('buildCacheKey()', () => {
+    it('returns the same key for identical requests', () => {
+        const request = { model: 'openai/gpt-5.4-mini', messages: [{ role: 'user', content: 'hi' }], temperature: 0 };
+        expect(buildCacheKey(request)).toBe(buildCacheKey({ ...request }));
+        expect(buildCacheKey(request)).toMatch(/^[0-9a-f]{64}$/);
+    });
+
+    it('returns different keys when any request field changes', () => {
+        const request = { model: 'openai/gpt-5.4-mini', messages: [{ role: 'user', content: 'hi' }], temperature: 0 };
+        expect(buildCacheKey(request)).not.toBe(buildCacheKey({ ...request, model: 'google/gemini-2.5-flash' }));
+        expect(buildCacheKey(request)).not.toBe(
+            buildCacheKey({ ...request, messages: [{ role: 'user', content: 'hello' }] }),
+        );
+    });
+});
+
+describe('getCachedResponse() / setCachedResponse()', () => {
+    let cacheDir: string;
+
+    beforeEach(() => {
+        cacheDir = mkdtempSync(join(tmpdir(), 'evals-llm-cache-'));
+    });
+
+    afterEach(() => {
+        rmSync(cacheDir, { recursive: true, force: true });
+    });
+
+    it('returns undefined on a miss', () => {
+        expect(getCachedResponse(buildCacheKey({ model: 'x' }), cacheDir)).toBeUndefined();
+    });
+
+    it('round-trips a stored response', () => {
+        const key = buildCacheKey({ model: 'x' });
+        const message = { role: 'assistant', content: null, tool_calls: [{ function: { name: 'search-actors' } }] };
+        setCachedResponse(key, message, cacheDir);
+        expect(getCachedResponse(key, cacheDir)).toEqual(message);
+    });
+
+    it('treats a corrupted entry as a miss', () => {
+        const key = buildCacheKey({ model: 'x' });
+        mkdirSync(join(cacheDir, key.slice(0, 2)), { recursive: true });
+        writeFileSync(join(cacheDir, key.slice(0, 2), `${key}.json`), '{"role":');
+        expect(getCachedResponse(key, cacheDir)).toBeUndefined();
+    });
+});
@@ -0,0 +1,85 @@
+import { describe, expect, it } from 'vitest';
+
+import { getSortedExpectedTools, getSortedOutputTools, sortedToolListsEqual } from '../../evals/shared/tool_match.js';
+
+function toolCall(name: string) {
+    return { id: `call-${name}`, type: 'function', function: { name, arguments: '{}' } };
+}
+
+describe('getSortedExpectedTools()', () => {
+    it('sorts a list of expected tools without mutating the input', () => {
+        const expectedTools = ['search-actors', 'fetch-actor-details'];
+        expect(getSortedExpectedTools(expectedTools)).toEqual(['fetch-actor-details', 'search-actors']);
+        expect(expectedTools).toEqual(['search-actors', 'fetch-actor-details']);
+    });
+
+    it('parses the legacy comma-joined string used by existing datasets', () => {
+        expect(getSortedExpectedTools('search-actors, fetch-actor-details')).toEqual([
+            'fetch-actor-details',
+            'search-actors',
+        ]);
+        expect(getSortedExpectedTools('call-actor')).toEqual(['call-actor']);
+    });
+
+    it('returns the same result for repeated legacy strings', () => {
+        const first = getSortedExpectedTools('get-dataset, get-dataset-items');
+        expect(getSortedExpectedTools('get-dataset, get-dataset-items')).toEqual(first);
+    });
+
+    it('returns an empty list for empty or missing values', () => {
+        expect(getSortedExpectedTools(undefined)).toEqual([]);
+        expect(getSortedExpectedTools(null)).toEqual([]);
+        expect(getSortedExpectedTools('')).toEqual([]);
+        expect(getSortedExpectedTools([])).toEqual([]);
+    });
+});
+
+describe('getSortedOutputTools()', () => {
+    it('returns distinct tool names sorted', () => {
+        expect(getSortedOutputTools([toolCall('search-actors'), toolCall('fetch-actor-details')])).toEqual([
+            'fetch-actor-details',
+            'search-actors',
+        ]);
+    });
+
+    it('collapses duplicate calls to the same tool', () => {
+        expect(
+            getSortedOutputTools([toolCall('search-actors'), toolCall('search-actors'), toolCall('search-actors')]),
+        ).toEqual(['search-actors']);
+    });
+
+    it('returns an empty list when the model called no tools', () => {
+        expect(getSortedOutputTools(undefined)).toEqual([]);
+        expect(getSortedOutputTools([])).toEqual([]);
+    });
+});
+
+describe('sortedToolListsEqual()', () => {
+    it('matches identical sorted lists', () => {
+        const tools = ['fetch-actor-details', 'search-actors'];
+        expect(sortedToolListsEqual(tools, [...tools])).toBe(true);
+    });
+
+    it('rejects lists of different length', () => {
+        expect(sortedToolListsEqual(['search-actors'], ['fetch-actor-details', 'search-actors'])).toBe(false);
+        expect(sortedToolListsEqual(['search-actors'], [])).toBe(false);
+    });
+
+    it('rejects lists of the same length with different tools', () => {
+        expect(sortedToolListsEqual(['search-actors'], ['call-actor'])).toBe(false);
+    });
+
+    it('matches expected list input against duplicate output calls', () => {
+        const expected = getSortedExpectedTools(['search-actors']);
+        const actual = getSortedOutputTools([toolCall('search-actors'), toolCall('search-actors')]);
+        expect(sortedToolListsEqual(expected, actual)).toBe(true);
+    });
+
+    it('matches legacy string input the same way as list input', () => {
+        const actual = getSortedOutputTools([toolCall('search-actors'), toolCall('fetch-actor-details')]);
+        const fromString = getSortedExpectedTools('search-actors, fetch-actor-details');
+        const fromList = getSortedExpectedTools(['search-actors', 'fetch-actor-details']);
+        expect(sortedToolListsEqual(fromString, actual)).toBe(true);
+        expect(sortedToolListsEqual(fromList, actual)).toBe(true);
+    });
+});